@@ -0,0 +1,6 @@
+import os
+import sys
+
+# The data scripts import each other as top-level modules (they are run from
+# this directory), so make that work when pytest is run from the repo root
+sys.path.insert(0, os.path.dirname(__file__))
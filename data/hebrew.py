@@ -0,0 +1,25 @@
+HEBREW_START = 0x0591
+ASCII_START = 33
+
+
+def to_ascii(s: str):
+    return "".join(
+        c if ord(c) < HEBREW_START else chr(ASCII_START + ord(c) - HEBREW_START)
+        for c in s
+    )
+
+
+def from_ascii(s: str):
+    # Mirrors fromASCIIHebrew in src/loadData.ts
+    return "".join(
+        c if c == " " else chr(ord(c) - ASCII_START + HEBREW_START)
+        for c in s
+    )
+
+
+def remove_initial_dagesh(s: str):
+    # Mirrors removeInitialDagesh in src/util.ts
+    if s[1:2] == "ו":
+        # Don't remove dagesh in shureq if it is the second letter of the word
+        return s
+    return s[:3].replace("\u05bc", "") + s[3:]
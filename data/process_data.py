@@ -1,15 +1,26 @@
 #!/usr/bin/env python3
 
+import gzip
 import json
+import os
 import random
 import re
+import sqlite3
 
 from collections import Counter
 from enum import Enum
-from typing import Any, Dict, Iterable, Iterator, List
+from typing import Any, Dict, Iterator, List
 
+from hebrew import remove_initial_dagesh, to_ascii
 from load_data import load_data
 from osm_patches import PATCHES
+from root_types import get_root_type_mask
+from verse_text import build_dictionaries, decode_text, encode_text
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
 
 
 class Language(str, Enum):
@@ -29,6 +40,10 @@ REPORT_STEM_ORDER = False
 REPORT_OSM_PARSINGS = True
 REPORT_TENSE_STATS = True
 
+WRITE_SQLITE = False
+ENCODE_VERSE_TEXT = False
+WRITE_BIAS_COUNTS = False
+
 VOWELS = set(
     "\u05b0\u05b1\u05b2\u05b3\u05b4\u05b5\u05b6\u05b7\u05b8\u05b9\u05ba\u05bb\u05bc"
 )
@@ -126,15 +141,6 @@ def has_vowels(s: str):
     return any(c in VOWELS for c in s)
 
 
-def to_ascii(s: str):
-    hebrew_start = 0x0591
-    ascii_start = 33
-    return "".join(
-        c if ord(c) < hebrew_start else chr(ascii_start + ord(c) - hebrew_start)
-        for c in s
-    )
-
-
 class UnhandledStemError(KeyError):
     def __init__(self, stem: str):
         self.stem = stem
@@ -197,15 +203,22 @@ class Book(HasId):
     def to_simple_obj(self):
         return self.book.replace("_", " ")
 
+    def to_row(self):
+        return (self.id, self.to_simple_obj())
+
 
 class Root(HasId):
     def __init__(self, n):
         self.lex = api.F.lex_utf8.v(n)
         self.freq_lex = api.F.freq_lex.v(n)
         self.gloss = api.F.gloss.v(n)
+        self.types = get_root_type_mask(self.lex)
 
     def to_simple_obj(self):
-        return [to_ascii(self.lex), self.freq_lex, self.gloss]
+        return [to_ascii(self.lex), self.freq_lex, self.gloss, self.types]
+
+    def to_row(self):
+        return (self.id, self.lex, self.freq_lex, self.gloss, self.types)
 
 
 class VerbForm(HasId):
@@ -229,6 +242,9 @@ class VerbForm(HasId):
             self.root.id,
         ]
 
+    def to_row(self):
+        return (self.id, self.verb, self.root.id)
+
 
 class VerbParsing(HasId):
     def __init__(self):
@@ -484,6 +500,23 @@ class VerbParsing(HasId):
 
         return result
 
+    def to_row(self):
+        return (
+            self.id,
+            self.stem,
+            self.tense,
+            self.person.replace("unknown", "NA"),
+            self.gender.replace("unknown", "NA"),
+            self.number.replace("unknown", "NA"),
+            self.pronom_person.replace("unknown", "NA"),
+            self.pronom_gender.replace("unknown", "NA"),
+            self.pronom_number.replace("unknown", "NA"),
+            1 if self.paragogic_nun else 0,
+            1 if self.paragogic_heh else 0,
+            1 if self.cohortative else 0,
+            1 if self.energic_nun else 0,
+        )
+
 
 class Verse(HasId):
     def __init__(self, n: int, book: Book):
@@ -509,13 +542,40 @@ class Verse(HasId):
             to_ascii(self.text),
         ]
 
+    def to_encoded_obj(self, word_ids: Dict[str, int], accent_ids: Dict[str, int]):
+        return [
+            self.book.id,
+            *self.reference[1:],
+            *encode_text(self.text, word_ids, accent_ids),
+        ]
+
+    def to_row(self):
+        return (self.id, self.book.id, *self.reference[1:], self.text)
+
 
 class VerbOccurrence:
-    def __init__(self, n: int, verb: VerbForm, parsings: Iterable[VerbParsing], verse: Verse):
+    def __init__(
+        self,
+        n: int,
+        verb: VerbForm,
+        parsings: List[VerbParsing],
+        verse: Verse,
+        has_osm: bool = False,
+    ):
         self.n = n
         self.verb = verb
         self.parsings = parsings
         self.verse = verse
+        self.has_osm = has_osm
+
+    @property
+    def bhsa_parsing(self) -> VerbParsing:
+        return self.parsings[0]
+
+    @property
+    def osm_parsing(self) -> VerbParsing | None:
+        # When OSM agrees with BHSA only the BHSA parsing is kept
+        return self.parsings[-1] if self.has_osm else None
 
     def to_simple_obj(self):
         return [
@@ -525,6 +585,17 @@ class VerbOccurrence:
             *(p.id for p in self.parsings),
         ]
 
+    def to_row(self, i: int):
+        osm_parsing = self.osm_parsing
+        return (
+            i,
+            self.n,
+            self.verb.id,
+            self.verse.id,
+            self.bhsa_parsing.id,
+            osm_parsing.id if osm_parsing else None,
+        )
+
     def should_skip(self, language: Language):
         r = random.random()
         if INCLUDE_ALL_FOR_STATS:
@@ -591,7 +662,7 @@ class DataManager:
         if p_osm and p_osm != p_bhs:
             parsings.append(self.parsings.get(str(p_osm), p_osm))
 
-        occurrence = VerbOccurrence(n, verb, parsings, verse)
+        occurrence = VerbOccurrence(n, verb, parsings, verse, p_osm is not None)
         if occurrence.should_skip(self.language):
             return
 
@@ -636,6 +707,63 @@ class DataManager:
         self.verbs.update_ids()
         self.verses.update_ids()
 
+    def get_spellings(self):
+        # Verbs with the same spelling (as compared by hasSameSpelling in
+        # src/util.ts) share a group. "groups" gives the group of each verb
+        # by verb ID, and "parsings" gives the distinct parsing IDs of each
+        # group with their occurrence counts, as flat [id, count, ...] lists
+        group_ids: Dict[str, int] = {}
+        verb_groups = []
+        for v in self.verbs.data:
+            key = remove_initial_dagesh(v.verb)
+            verb_groups.append(group_ids.setdefault(key, len(group_ids)))
+
+        counts = [Counter() for _ in group_ids]
+        for o in self.occurrences:
+            for p in o.parsings:
+                counts[verb_groups[o.verb.id]][p.id] += 1
+
+        return {
+            "groups": verb_groups,
+            "parsings": [
+                [n for item in c.most_common() for n in item]
+                for c in counts
+            ],
+        }
+
+    def get_encoded_verses(self):
+        # Verse texts as IDs into an unaccented word form dictionary and an
+        # accent pattern dictionary, both ordered by frequency (see
+        # verse_text.py)
+        words, accents = build_dictionaries(v.text for v in self.verses.data)
+        word_ids = {word: i for i, word in enumerate(words)}
+        accent_ids = {pattern: i for i, pattern in enumerate(accents)}
+        verses = []
+        for v in self.verses.data:
+            encoded = v.to_encoded_obj(word_ids, accent_ids)
+            if decode_text(*encoded[-2:], words, accents) != v.text:
+                raise RuntimeError(f"Verse text does not round-trip: {v}")
+            verses.append(encoded)
+        return (
+            [to_ascii(word) for word in words],
+            [to_ascii(pattern) for pattern in accents],
+            verses,
+        )
+
+    def get_counts(self):
+        # Occurrence counts grouped by root and parsings, as
+        # [root id, count, *parsing ids] rows. The filter only looks at an
+        # occurrence's root and parsings, so getBiasedVerbs in src/bias.ts
+        # can count the rows that pass it instead of every occurrence
+        counts = Counter(
+            (o.verb.root.id, *(p.id for p in o.parsings))
+            for o in self.occurrences
+        )
+        return sorted(
+            [root, count, *parsings]
+            for (root, *parsings), count in counts.items()
+        )
+
     def stats(self):
         print("Roots", len(self.roots))
         print("Verbs", len(self.verbs))
@@ -666,6 +794,17 @@ class DataManager:
             for tense, count in tense_counts.most_common():
                 print(f"{tense}: {count}")
 
+        # getAllValidParsings in src/util.ts assumes verbs with the same
+        # spelling share a root
+        spelling_roots: Dict[str, set] = {}
+        for v in self.verbs.data:
+            key = remove_initial_dagesh(v.verb)
+            spelling_roots.setdefault(key, set()).add(v.root.id)
+        print(
+            "Spellings with more than one root",
+            sum(len(roots) > 1 for roots in spelling_roots.values()),
+        )
+
         if REPORT_OSM_PARSINGS:
             print(
                 "OSM parsings in use",
@@ -724,6 +863,106 @@ def write_json(data: Any, filename: str):
             check_circular=False,
         )
 
+def compressed_size(data: Any):
+    # The JSON is served brotli-compressed; fall back to gzip as an estimate
+    encoded = json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
+    if brotli is not None:
+        return len(brotli.compress(encoded, quality=11))
+    return len(gzip.compress(encoded, 9))
+
+SQLITE_SCHEMA = """
+CREATE TABLE books (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL
+);
+CREATE TABLE roots (
+    id INTEGER PRIMARY KEY,
+    lex TEXT NOT NULL,
+    freq_lex INTEGER NOT NULL,
+    gloss TEXT NOT NULL,
+    types INTEGER NOT NULL
+);
+CREATE TABLE verbs (
+    id INTEGER PRIMARY KEY,
+    verb TEXT NOT NULL,
+    root_id INTEGER NOT NULL REFERENCES roots(id)
+);
+CREATE TABLE verses (
+    id INTEGER PRIMARY KEY,
+    book_id INTEGER NOT NULL REFERENCES books(id),
+    chapter INTEGER NOT NULL,
+    verse INTEGER NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE TABLE parsings (
+    id INTEGER PRIMARY KEY,
+    stem TEXT NOT NULL,
+    tense TEXT NOT NULL,
+    person TEXT NOT NULL,
+    gender TEXT NOT NULL,
+    number TEXT NOT NULL,
+    pronom_person TEXT NOT NULL,
+    pronom_gender TEXT NOT NULL,
+    pronom_number TEXT NOT NULL,
+    paragogic_nun INTEGER NOT NULL,
+    paragogic_heh INTEGER NOT NULL,
+    cohortative INTEGER NOT NULL,
+    energic_nun INTEGER NOT NULL
+);
+CREATE TABLE occurrences (
+    id INTEGER PRIMARY KEY,
+    node INTEGER NOT NULL,
+    verb_id INTEGER NOT NULL REFERENCES verbs(id),
+    verse_id INTEGER NOT NULL REFERENCES verses(id),
+    bhsa_parsing_id INTEGER NOT NULL REFERENCES parsings(id),
+    osm_parsing_id INTEGER REFERENCES parsings(id)
+);
+
+CREATE INDEX parsings_stem ON parsings(stem);
+CREATE INDEX parsings_tense ON parsings(tense);
+CREATE INDEX verbs_root ON verbs(root_id);
+CREATE INDEX verses_book ON verses(book_id);
+CREATE INDEX occurrences_node ON occurrences(node);
+CREATE INDEX occurrences_verb ON occurrences(verb_id);
+CREATE INDEX occurrences_verse ON occurrences(verse_id);
+CREATE INDEX occurrences_bhsa_parsing ON occurrences(bhsa_parsing_id);
+CREATE INDEX occurrences_osm_parsing ON occurrences(osm_parsing_id);
+"""
+
+
+def write_sqlite(data: DataManager, filename: str):
+    if os.path.exists(filename):
+        os.remove(filename)
+
+    with sqlite3.connect(filename) as connection:
+        connection.executescript(SQLITE_SCHEMA)
+        connection.executemany(
+            "INSERT INTO books VALUES (?, ?)",
+            (book.to_row() for book in data.books.data),
+        )
+        connection.executemany(
+            "INSERT INTO roots VALUES (?, ?, ?, ?, ?)",
+            (root.to_row() for root in data.roots.data),
+        )
+        connection.executemany(
+            "INSERT INTO verbs VALUES (?, ?, ?)",
+            (v.to_row() for v in data.verbs.data),
+        )
+        connection.executemany(
+            "INSERT INTO verses VALUES (?, ?, ?, ?, ?)",
+            (v.to_row() for v in data.verses.data),
+        )
+        connection.executemany(
+            "INSERT INTO parsings VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (p.to_row() for p in data.parsings.data),
+        )
+        connection.executemany(
+            "INSERT INTO occurrences VALUES (?, ?, ?, ?, ?, ?)",
+            (o.to_row(i) for i, o in enumerate(data.occurrences)),
+        )
+    connection.close()
+
+
 def main():
     for language in Language:
         data = DataManager(language)
@@ -732,17 +971,35 @@ def main():
         data.finish()
         data.stats()
 
-        write_json(
-            {
-                "verbs": [v.to_simple_obj() for v in data.verbs.data],
-                "occurrences": [o.to_simple_obj() for o in data.occurrences],
-                "parsings": [p.to_simple_obj() for p in data.parsings.data],
-                "verses": [v.to_simple_obj() for v in data.verses.data],
-                "roots": [root.to_simple_obj() for root in data.roots.data],
-                "books": [book.to_simple_obj() for book in data.books.data],
-            },
-            f"../public/{language.value.lower()}.json",
-        )
+        output = {
+            "verbs": [v.to_simple_obj() for v in data.verbs.data],
+            "occurrences": [o.to_simple_obj() for o in data.occurrences],
+            "parsings": [p.to_simple_obj() for p in data.parsings.data],
+            "verses": [v.to_simple_obj() for v in data.verses.data],
+            "roots": [root.to_simple_obj() for root in data.roots.data],
+            "books": [book.to_simple_obj() for book in data.books.data],
+            "spellings": data.get_spellings(),
+        }
+        if WRITE_BIAS_COUNTS:
+            output["counts"] = data.get_counts()
+        if ENCODE_VERSE_TEXT:
+            words, accents, verses = data.get_encoded_verses()
+            plain_size = compressed_size(output["verses"])
+            encoded_size = compressed_size([words, accents, verses])
+            print(
+                "Verse text size (compressed)",
+                f"{plain_size} plain, {encoded_size} encoded",
+            )
+            # Only worthwhile when the dictionaries repeat enough to beat
+            # compressing the plain text
+            if encoded_size < plain_size:
+                output["words"] = words
+                output["accents"] = accents
+                output["verses"] = verses
+
+        write_json(output, f"../public/{language.value.lower()}.json")
+        if WRITE_SQLITE:
+            write_sqlite(data, f"{language.value.lower()}.sqlite")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+
+"""
+Indexed query engine over a built language file (e.g. public/hebrew.json).
+
+Mirrors getFilterFromConditions in src/filter.ts, but answers a filter
+condition by intersecting precomputed occurrence bitsets instead of testing
+every occurrence. Can also be run as a local HTTP stand-in service:
+
+    python query.py ../public/hebrew.json --port 8000
+    curl -X POST localhost:8000/query -d @conditions.json
+"""
+
+import argparse
+import json
+import os
+
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterable, Iterator, List
+
+from hebrew import from_ascii
+from root_types import ROOT_TYPES, get_root_type_mask
+
+STEM_NAMES = {
+    "hebrew": {
+        1: "Qal",
+        2: "Hiphil",
+        3: "Piel",
+        4: "Niphal",
+        5: "Hithpael",
+        6: "Pual",
+        7: "Hophal",
+    },
+    "aramaic": {
+        1: "Peal",
+        2: "Haphel",
+        3: "Pael",
+        4: "Hithpaal",
+        5: "Hithpeel",
+        6: "Peil",
+        7: "Hophal",
+    },
+}
+TENSE_NAMES = {
+    1: "Qatal",
+    2: "Yiqtol",
+    3: "Wayyiqtol",
+    4: "Active participle",
+    5: "Infinitive construct",
+    6: "Imperative",
+    7: "Passive participle",
+    8: "Infinitive absolute",
+}
+ARAMAIC_TENSE_NAMES = {
+    "Infinitive construct": "Infinitive",
+    "Infinitive absolute": "Infinitive",
+    "Active participle": "Participle",
+    "Passive participle": "Participle",
+}
+EXTRAS = {
+    "cohortatives": 6,
+    "energicNuns": 7,
+    "paragogicHehs": 5,
+    "paragogicNuns": 4,
+}
+
+
+def to_bitset(indexes: Iterable[int]) -> int:
+    indexes = list(indexes)
+    if not indexes:
+        return 0
+    bits = bytearray(max(indexes) // 8 + 1)
+    for i in indexes:
+        bits[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(bits, "little")
+
+
+def iter_bitset(bitset: int) -> Iterator[int]:
+    bits = bitset.to_bytes((bitset.bit_length() + 7) // 8, "little")
+    for byte_index, byte in enumerate(bits):
+        while byte:
+            low = byte & -byte
+            yield byte_index * 8 + low.bit_length() - 1
+            byte ^= low
+
+
+class OccurrenceIndex:
+    def __init__(self, data: Dict[str, Any], language: str = "hebrew"):
+        self.language = language
+        self.data = data
+        self.size = len(data["occurrences"])
+        self.all = (1 << self.size) - 1
+
+        stem_names = STEM_NAMES[language]
+        parsings = [
+            {
+                "stem": stem_names[p[0]],
+                "tense": self.get_tense(p[1]),
+                "suffix": any(p[3]),
+                **{extra: p[i] == 1 for extra, i in EXTRAS.items()},
+            }
+            for p in data["parsings"]
+        ]
+        roots = [
+            {
+                "root": from_ascii(root),
+                "count": count,
+                # Older builds don't include the root type mask
+                "types": rest[1] if len(rest) > 1 else get_root_type_mask(from_ascii(root)),
+            }
+            for root, count, *rest in data["roots"]
+        ]
+
+        by_stem: Dict[str, List[int]] = {}
+        by_tense: Dict[str, List[int]] = {}
+        by_root_type: Dict[str, List[int]] = {}
+        by_book: Dict[int, List[int]] = {}
+        by_extra: Dict[str, List[int]] = {extra: [] for extra in EXTRAS}
+        by_count: Dict[int, List[int]] = {}
+        all_suffixes = []
+        any_suffix = []
+        passive_participles = []
+        laqah_qal = []
+
+        for i, (verb, verse, _, *parsing_ids) in enumerate(data["occurrences"]):
+            root = roots[data["verbs"][verb][1]]
+            occurrence_parsings = [parsings[p] for p in parsing_ids]
+            for parsing in occurrence_parsings:
+                by_stem.setdefault(parsing["stem"], []).append(i)
+                by_tense.setdefault(parsing["tense"], []).append(i)
+            for bit, root_type in enumerate(ROOT_TYPES):
+                if root["types"] & (1 << bit):
+                    by_root_type.setdefault(root_type, []).append(i)
+            by_book.setdefault(data["verses"][verse][0], []).append(i)
+            by_count.setdefault(root["count"], []).append(i)
+
+            for extra in EXTRAS:
+                if any(p[extra] for p in occurrence_parsings):
+                    by_extra[extra].append(i)
+            if all(p["suffix"] for p in occurrence_parsings):
+                all_suffixes.append(i)
+            if any(p["suffix"] for p in occurrence_parsings):
+                any_suffix.append(i)
+            if all(
+                p["stem"] != "Qal" and p["tense"] == "Passive participle"
+                for p in occurrence_parsings
+            ):
+                passive_participles.append(i)
+            if root["root"] == "לקח" and occurrence_parsings[0]["stem"] == "Qal":
+                laqah_qal.append(i)
+
+        self.by_stem = {k: to_bitset(v) for k, v in by_stem.items()}
+        self.by_tense = {k: to_bitset(v) for k, v in by_tense.items()}
+        self.by_root_type = {k: to_bitset(v) for k, v in by_root_type.items()}
+        self.by_book = {k: to_bitset(v) for k, v in by_book.items()}
+        self.by_extra = {k: to_bitset(v) for k, v in by_extra.items()}
+        self.all_suffixes = to_bitset(all_suffixes)
+        self.any_suffix = to_bitset(any_suffix)
+        self.passive_participles = to_bitset(passive_participles)
+        self.laqah_qal = to_bitset(laqah_qal)
+
+        # Frequency buckets: at_least[i] holds every occurrence whose root
+        # count is at least counts[i]
+        self.counts = sorted(by_count)
+        self.at_least = [0] * len(self.counts)
+        bitset = 0
+        for i in reversed(range(len(self.counts))):
+            bitset |= to_bitset(by_count[self.counts[i]])
+            self.at_least[i] = bitset
+
+    @staticmethod
+    def from_file(filename: str, language: str | None = None):
+        if language is None:
+            language = os.path.splitext(os.path.basename(filename))[0].lower()
+            if language not in STEM_NAMES:
+                raise ValueError(
+                    f"Can't tell the language of {filename} from its name; "
+                    f"pass the language (--language) as one of: {', '.join(STEM_NAMES)}"
+                )
+        with open(filename, encoding="utf-8") as file_object:
+            return OccurrenceIndex(json.load(file_object), language)
+
+    def get_tense(self, code: int):
+        tense = TENSE_NAMES[code]
+        if self.language == "aramaic":
+            return ARAMAIC_TENSE_NAMES.get(tense, tense)
+        return tense
+
+    @staticmethod
+    def union(index: Dict[Any, int], keys: Iterable[Any]):
+        bitset = 0
+        for key in keys:
+            bitset |= index.get(key, 0)
+        return bitset
+
+    def with_min_frequency(self, min_frequency: int):
+        i = bisect_left(self.counts, min_frequency)
+        return self.at_least[i] if i < len(self.at_least) else 0
+
+    def query(self, condition: Dict[str, Any] | None) -> int:
+        if not condition:
+            return self.all
+
+        result = self.with_min_frequency(condition["minFrequency"])
+
+        stems = [k for k, v in condition["stem"].items() if v]
+        result &= self.union(self.by_stem, stems)
+
+        tenses = [k for k, v in condition["tense"].items() if v]
+        tense_matches = self.union(self.by_tense, tenses)
+        if condition["tense"].get("Active participle"):
+            tense_matches |= self.passive_participles
+        result &= tense_matches
+
+        if not condition["suffixes"]["include"]:
+            result &= ~self.all_suffixes
+        elif condition["suffixes"]["exclusive"]:
+            result &= self.any_suffix
+
+        for extra in EXTRAS:
+            if not condition["extras"].get(extra):
+                result &= ~self.by_extra[extra]
+
+        for root_type in ROOT_TYPES:
+            if not condition["root"].get(root_type):
+                result &= ~self.by_root_type.get(root_type, 0)
+        if not condition["root"].get("1-nun"):
+            result &= ~self.laqah_qal
+
+        # Not part of FilterCondition; optional list of book indexes
+        if condition.get("books") is not None:
+            result &= self.union(self.by_book, condition["books"])
+
+        return result & self.all
+
+    def get_occurrences(self, condition: Dict[str, Any] | None) -> List[int]:
+        return list(iter_bitset(self.query(condition)))
+
+
+def serve(index: OccurrenceIndex, host: str, port: int):
+    class QueryHandler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            if self.path != "/query":
+                self.send_error(404)
+                return
+            length = int(self.headers.get("Content-Length") or 0)
+            try:
+                condition = json.loads(self.rfile.read(length) or "null")
+                occurrences = index.get_occurrences(condition)
+            except (ValueError, KeyError, TypeError, AttributeError) as e:
+                self.send_error(400, f"Invalid filter condition: {e}")
+                return
+            body = json.dumps(
+                {"occurrences": occurrences},
+                separators=(",", ":"),
+            ).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer((host, port), QueryHandler)
+    print(f"Serving {index.size} occurrences on http://{host}:{port}/query")
+    server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("filename", help="built language file, e.g. ../public/hebrew.json")
+    parser.add_argument("--language", choices=list(STEM_NAMES))
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+
+    try:
+        index = OccurrenceIndex.from_file(args.filename, args.language)
+    except ValueError as e:
+        parser.error(str(e))
+    serve(index, args.host, args.port)
+
+
+if __name__ == "__main__":
+    main()
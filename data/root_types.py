@@ -0,0 +1,78 @@
+from typing import Set
+
+# Same order as ALL_ROOT_TYPES in src/util.ts (bit i of a root type mask)
+ROOT_TYPES = [
+    "strong",
+    "1-gutteral",
+    "1-aleph",
+    "1-nun",
+    "1-waw",
+    "2-gutteral",
+    "3-heh",
+    "3-aleph",
+    "hollow",
+    "geminate",
+]
+
+
+def replace_sofits(s: str) -> str:
+    return (
+        s
+        .replace("ך", "כ", 1)
+        .replace("ם", "מ", 1)
+        .replace("ן", "נ", 1)
+        .replace("ף", "פ", 1)
+        .replace("ץ", "צ", 1)
+    )
+
+
+def get_root_types(root: str) -> Set[str]:
+    # Mirrors getRootTypes in src/util.ts
+    root_types = set()
+    normalised_root = root.replace("ׁ", "").replace("ׂ", "")
+    r1 = normalised_root[0:1]
+    r2 = normalised_root[1:2]
+    r3 = normalised_root[2:3]
+
+    if r1 and r1 in "עהחר":
+        root_types.add("1-gutteral")
+
+    if r1 == "א":
+        root_types.add("1-aleph")
+
+    if r1 == "נ":
+        root_types.add("1-nun")
+
+    if (r1 and r1 in "וי") or root == "הלך":
+        root_types.add("1-waw")
+
+    if r2 and r2 in "אעהחר":
+        root_types.add("2-gutteral")
+
+    if r3 == "ה":
+        root_types.add("3-heh")
+
+    if r3 == "א":
+        root_types.add("3-aleph")
+
+    if (
+        ((r2 and r2 in "וי") or len(normalised_root) == 2)
+        and root != "היה"
+        and root != "חיה"
+        and root != "צוה"
+    ):
+        root_types.add("hollow")
+
+    if r3 and r2 == replace_sofits(r3):
+        root_types.add("geminate")
+
+    if not root_types:
+        root_types.add("strong")
+
+    return root_types
+
+
+def get_root_type_mask(root: str) -> int:
+    # Bit i is set when the root has type ROOT_TYPES[i]
+    root_types = get_root_types(root)
+    return sum(1 << i for i, t in enumerate(ROOT_TYPES) if t in root_types)
@@ -0,0 +1,57 @@
+import json
+import os
+import re
+import shutil
+import subprocess
+
+import pytest
+
+from hebrew import remove_initial_dagesh
+
+WORDS = [
+    "קוּם",  # shureq as the second letter keeps its dagesh
+    "שׁוּבוּ",
+    "תִּשְׁמֹר",
+    "דִּבֶּר",
+    "בְּרָא",
+    "וַיִּקְטֹל",
+    "יִקְטֹל",
+    "פּ",
+    "",
+]
+
+
+@pytest.mark.parametrize("word, expected", [
+    ("קוּם", "קוּם"),
+    ("תִּשְׁמֹר", "תִשְׁמֹר"),
+    ("דִּבֶּר", "דִבֶּר"),
+    ("וַיִּקְטֹל", "וַיִּקְטֹל"),
+    ("יִקְטֹל", "יִקְטֹל"),
+])
+def test_remove_initial_dagesh(word, expected):
+    assert remove_initial_dagesh(word) == expected
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="needs node")
+def test_remove_initial_dagesh_matches_frontend():
+    filename = os.path.join(os.path.dirname(__file__), "..", "src", "util.ts")
+    with open(filename, encoding="utf-8") as file_object:
+        source = file_object.read()
+    match = re.search(
+        r"export function removeInitialDagesh\(s: string\) \{.*?\n\}",
+        source,
+        re.DOTALL,
+    )
+    assert match
+    function = match.group(0).replace("export ", "").replace("s: string", "s")
+    script = (
+        function
+        + f"\nconsole.log(JSON.stringify({json.dumps(WORDS)}.map(removeInitialDagesh)))"
+    )
+    result = subprocess.run(
+        ["node", "-e", script],
+        capture_output=True,
+        check=True,
+        encoding="utf-8",
+    )
+    assert json.loads(result.stdout) == [remove_initial_dagesh(w) for w in WORDS]
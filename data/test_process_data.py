@@ -0,0 +1,231 @@
+import sqlite3
+import sys
+import types
+
+from unittest import mock
+
+import pytest
+
+from root_types import get_root_type_mask
+
+# A tiny stand-in for the BHSA corpus, so that process_data can be imported
+# without Text-Fabric. Words refer to their lexeme and verse nodes.
+WORDS = {
+    1: {
+        "g_word_utf8": "נָתַ֖ן",
+        "lex": 101,
+        "verse": 1001,
+        "vs": "qal",
+        "vt": "perf",
+        "ps": "p3",
+        "gn": "m",
+        "nu": "sg",
+        "osm": "HVqp3ms",  # agrees with BHSA
+    },
+    2: {
+        "g_word_utf8": "תִּתֵּ֣ן",
+        "lex": 101,
+        "verse": 1001,
+        "vs": "qal",
+        "vt": "impf",
+        "ps": "p2",
+        "gn": "m",
+        "nu": "sg",
+        "osm": "HVqi2ms",
+    },
+    3: {
+        "g_word_utf8": "תִתֵּ֣ן",
+        "lex": 101,
+        "verse": 1002,
+        "vs": "qal",
+        "vt": "impf",
+        "ps": "p2",
+        "gn": "m",
+        "nu": "sg",
+        "osm": None,  # no OSM parsing
+    },
+    4: {
+        "g_word_utf8": "הִקְטִ֑יל",
+        "lex": 102,
+        "verse": 1003,
+        "vs": "hif",
+        "vt": "perf",
+        "ps": "p3",
+        "gn": "m",
+        "nu": "sg",
+        "osm": "HVpp3ms",  # disagrees with BHSA on the stem
+    },
+    5: {
+        "g_word_utf8": "דָּבָ֖ר",
+        "lex": 103,
+        "verse": 1003,
+        "sp": "subs",
+    },
+}
+LEXEMES = {
+    101: {"lex_utf8": "נתן", "freq_lex": 2000, "gloss": "give"},
+    102: {"lex_utf8": "קטל", "freq_lex": 100, "gloss": "kill"},
+    103: {"lex_utf8": "דבר", "freq_lex": 1000, "gloss": "word"},
+}
+VERSES = {
+    1001: (("Genesis", 1, 1), "נָתַ֖ן תִּתֵּ֣ן׃ "),
+    1002: (("Genesis", 1, 2), "תִתֵּ֣ן׃ "),
+    1003: (("1_Kings", 2, 3), "הִקְטִ֑יל דָּבָ֖ר׃ "),
+}
+
+
+class Feature:
+    def __init__(self, name):
+        self.name = name
+
+    def v(self, n):
+        if n in LEXEMES:
+            return LEXEMES[n].get(self.name)
+        word = WORDS.get(n, {})
+        defaults = {
+            "otype": "word" if n in WORDS else None,
+            "language": "Hebrew",
+            "sp": "verb",
+            "g_vbe_utf8": "",
+            "prs_ps": "NA",
+            "prs_gn": "NA",
+            "prs_nu": "NA",
+        }
+        if self.name in ("lex_utf8", "freq_lex", "gloss"):
+            return LEXEMES[word["lex"]][self.name]
+        return word.get(self.name, defaults.get(self.name))
+
+
+def make_api():
+    return types.SimpleNamespace(
+        F=types.SimpleNamespace(**{
+            name: Feature(name)
+            for name in (
+                "otype", "language", "sp", "lex_utf8", "freq_lex", "gloss",
+                "g_word_utf8", "g_vbe_utf8", "vs", "vt", "ps", "gn", "nu",
+                "prs_ps", "prs_gn", "prs_nu", "osm", "osm_sf",
+            )
+        }),
+        T=types.SimpleNamespace(
+            bookName=lambda n: VERSES[WORDS[n]["verse"]][0][0],
+            sectionFromNode=lambda n: VERSES[WORDS[n]["verse"]][0],
+            text=lambda n: VERSES[n][1],
+        ),
+        L=types.SimpleNamespace(
+            u=lambda n, otype: [WORDS[n]["lex" if otype == "lex" else "verse"]],
+        ),
+        N=types.SimpleNamespace(
+            walk=lambda: iter([*WORDS, *LEXEMES, *VERSES]),
+        ),
+    )
+
+
+@pytest.fixture(scope="module")
+def process_data():
+    if sys.version_info < (3, 12):
+        pytest.skip("process_data.py needs Python 3.12")
+    load_data = types.ModuleType("load_data")
+    load_data.load_data = make_api
+    with mock.patch.dict(sys.modules, {"load_data": load_data}):
+        import process_data
+    return process_data
+
+
+@pytest.fixture(scope="module")
+def data(process_data):
+    data = process_data.DataManager(process_data.Language.HEBREW)
+    for n in process_data.api.N.walk():
+        data.process(n)
+    data.finish()
+    return data
+
+
+def test_write_sqlite(process_data, data, tmp_path):
+    filename = tmp_path / "hebrew.sqlite"
+    # Any existing file is replaced
+    filename.write_text("stale")
+    process_data.write_sqlite(data, str(filename))
+
+    connection = sqlite3.connect(filename)
+    tables = {
+        name: [row[0] for row in connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = ?",
+            (name,),
+        )]
+        for name, in connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table'"
+        )
+    }
+    assert tables == {
+        "books": [],
+        "roots": [],
+        "verbs": ["verbs_root"],
+        "verses": ["verses_book"],
+        "parsings": ["parsings_stem", "parsings_tense"],
+        "occurrences": [
+            "occurrences_node",
+            "occurrences_verb",
+            "occurrences_verse",
+            "occurrences_bhsa_parsing",
+            "occurrences_osm_parsing",
+        ],
+    }
+
+    assert sorted(connection.execute("SELECT name FROM books")) == [
+        ("1 Kings",),
+        ("Genesis",),
+    ]
+    assert sorted(connection.execute("SELECT lex, freq_lex, gloss, types FROM roots")) == [
+        ("נתן", 2000, "give", get_root_type_mask("נתן")),
+        ("קטל", 100, "kill", get_root_type_mask("קטל")),
+    ]
+
+    rows = connection.execute("""
+        SELECT o.node, v.verb, r.lex, b.name, s.chapter, s.verse, s.text,
+            bhsa.stem, bhsa.tense, bhsa.person, bhsa.gender, bhsa.number,
+            bhsa.pronom_person, osm.stem
+        FROM occurrences o
+        JOIN verbs v ON v.id = o.verb_id
+        JOIN roots r ON r.id = v.root_id
+        JOIN verses s ON s.id = o.verse_id
+        JOIN books b ON b.id = s.book_id
+        JOIN parsings bhsa ON bhsa.id = o.bhsa_parsing_id
+        LEFT JOIN parsings osm ON osm.id = o.osm_parsing_id
+        ORDER BY o.id
+    """).fetchall()
+    connection.close()
+    assert rows == [
+        (1, "נָתַן", "נתן", "Genesis", 1, 1, "נָתַ֖ן תִּתֵּ֣ן", "qal", "perf", "3", "m", "s", "NA", "qal"),
+        (2, "תִּתֵּן", "נתן", "Genesis", 1, 1, "נָתַ֖ן תִּתֵּ֣ן", "qal", "impf", "2", "m", "s", "NA", "qal"),
+        (3, "תִתֵּן", "נתן", "Genesis", 1, 2, "תִתֵּ֣ן", "qal", "impf", "2", "m", "s", "NA", None),
+        (4, "הִקְטִיל", "קטל", "1 Kings", 2, 3, "הִקְטִ֑יל דָּבָ֖ר", "hif", "perf", "3", "m", "s", "NA", "piel"),
+    ]
+
+
+def test_get_spellings(data):
+    spellings = data.get_spellings()
+    verbs = {v.verb: v.id for v in data.verbs.data}
+    groups = {verb: spellings["groups"][i] for verb, i in verbs.items()}
+
+    # Only an initial dagesh tells these apart
+    assert groups["תִּתֵּן"] == groups["תִתֵּן"]
+    assert len(set(groups.values())) == 3
+    assert spellings["parsings"][groups["תִּתֵּן"]] == [
+        data.occurrences[1].bhsa_parsing.id, 2,
+    ]
+    # Parsings that OSM disagrees on are counted too
+    assert sorted(spellings["parsings"][groups["הִקְטִיל"]][1::2]) == [1, 1]
+
+
+def test_get_counts(data):
+    root_ids = {r.lex: r.id for r in data.roots.data}
+    counts = {
+        (root, *parsings): count
+        for root, count, *parsings in data.get_counts()
+    }
+    o = data.occurrences
+    assert counts == {
+        (root_ids["נתן"], o[0].bhsa_parsing.id): 1,
+        (root_ids["נתן"], o[1].bhsa_parsing.id): 2,
+        (root_ids["קטל"], o[3].bhsa_parsing.id, o[3].osm_parsing.id): 1,
+    }
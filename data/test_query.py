@@ -0,0 +1,225 @@
+import json
+import os
+import random
+
+import pytest
+
+from hebrew import from_ascii, to_ascii
+from query import (
+    ARAMAIC_TENSE_NAMES,
+    EXTRAS,
+    STEM_NAMES,
+    TENSE_NAMES,
+    OccurrenceIndex,
+)
+from root_types import ROOT_TYPES, get_root_types
+
+
+def reference_filter(index: OccurrenceIndex, condition):
+    # Straight port of getFilterFromConditions and checkRootType in
+    # src/filter.ts, testing one occurrence at a time
+    data = index.data
+    result = []
+    for i, (verb, _, _, *parsing_ids) in enumerate(data["occurrences"]):
+        root, count, *_ = data["roots"][data["verbs"][verb][1]]
+        root = from_ascii(root)
+        parsings = [
+            {
+                "stem": STEM_NAMES[index.language][data["parsings"][p][0]],
+                "tense": index.get_tense(data["parsings"][p][1]),
+                "suffix": any(data["parsings"][p][3]),
+                **{e: data["parsings"][p][j] == 1 for e, j in EXTRAS.items()},
+            }
+            for p in parsing_ids
+        ]
+
+        if condition["minFrequency"] > count:
+            continue
+        if not any(condition["stem"].get(p["stem"]) for p in parsings):
+            continue
+        if not any(condition["tense"].get(p["tense"]) for p in parsings):
+            if any(
+                p["stem"] == "Qal"
+                or p["tense"] != "Passive participle"
+                or not condition["tense"].get("Active participle")
+                for p in parsings
+            ):
+                continue
+        if (
+            not condition["suffixes"]["include"]
+            and all(p["suffix"] for p in parsings)
+        ):
+            continue
+        if (
+            condition["suffixes"]["include"]
+            and condition["suffixes"]["exclusive"]
+            and not any(p["suffix"] for p in parsings)
+        ):
+            continue
+        if any(
+            not condition["extras"].get(e) and any(p[e] for p in parsings)
+            for e in EXTRAS
+        ):
+            continue
+        if (
+            not condition["root"].get("1-nun")
+            and root == "לקח"
+            and parsings[0]["stem"] == "Qal"
+        ):
+            continue
+        root_types = get_root_types(root)
+        if any(not condition["root"].get(t) and t in root_types for t in ROOT_TYPES):
+            continue
+        result.append(i)
+    return result
+
+
+def make_condition(language="hebrew", **overrides):
+    tenses = list(TENSE_NAMES.values())
+    if language == "aramaic":
+        tenses = list(dict.fromkeys(ARAMAIC_TENSE_NAMES.get(t, t) for t in tenses))
+    condition = {
+        "root": {t: True for t in ROOT_TYPES},
+        "stem": {s: True for s in STEM_NAMES[language].values()},
+        "tense": {t: True for t in tenses},
+        "suffixes": {"include": True, "exclusive": False},
+        "extras": {e: True for e in EXTRAS},
+        "minFrequency": 0,
+    }
+    for key, value in overrides.items():
+        if isinstance(value, dict):
+            condition[key] = {**condition[key], **value}
+        else:
+            condition[key] = value
+    for key, value in condition.items():
+        # A None override leaves the key out, like a condition saved before
+        # that option existed
+        if isinstance(value, dict):
+            condition[key] = {k: v for k, v in value.items() if v is not None}
+    return condition
+
+
+ROOTS = ["לקח", "נתן", "קטל", "אמר", "סבב"]
+ROOT_COUNTS = [900, 2000, 30, 5000, 50]
+
+# (root, [(stem, tense, has suffix, paragogic nun, paragogic heh,
+# cohortative, energic nun), ...])
+OCCURRENCES = [
+    ("לקח", [(1, 1, 0, 0, 0, 0, 0)]),
+    ("לקח", [(2, 1, 0, 0, 0, 0, 0)]),
+    ("נתן", [(1, 1, 0, 0, 0, 0, 0)]),
+    ("קטל", [(3, 7, 0, 0, 0, 0, 0)]),
+    ("קטל", [(1, 7, 0, 0, 0, 0, 0)]),
+    ("קטל", [(3, 7, 0, 0, 0, 0, 0), (1, 7, 0, 0, 0, 0, 0)]),
+    ("אמר", [(1, 2, 1, 0, 0, 0, 0)]),
+    ("אמר", [(1, 2, 1, 0, 0, 0, 0), (1, 2, 0, 0, 0, 0, 0)]),
+    ("אמר", [(1, 2, 0, 0, 0, 1, 0)]),
+    ("אמר", [(1, 2, 0, 0, 0, 0, 1)]),
+    ("אמר", [(1, 2, 0, 0, 1, 0, 0)]),
+    ("סבב", [(1, 2, 0, 1, 0, 0, 0)]),
+]
+
+
+@pytest.fixture(scope="module")
+def index():
+    parsings = []
+    occurrences = []
+    for i, (root, occurrence_parsings) in enumerate(OCCURRENCES):
+        parsing_ids = []
+        for stem, tense, suffix, *extras in occurrence_parsings:
+            parsing_ids.append(len(parsings))
+            parsings.append([
+                stem,
+                tense,
+                [3, 1, 1],
+                [3, 1, 1] if suffix else [0, 0, 0],
+                *extras,
+            ])
+        occurrences.append([ROOTS.index(root), i % 2, 1000 + i, *parsing_ids])
+    data = {
+        "books": ["Genesis", "Exodus"],
+        "roots": [
+            [to_ascii(root), count, ""]
+            for root, count in zip(ROOTS, ROOT_COUNTS)
+        ],
+        "verbs": [[to_ascii(root), i] for i, root in enumerate(ROOTS)],
+        "verses": [[0, 1, 1, ""], [1, 1, 1, ""]],
+        "parsings": parsings,
+        "occurrences": occurrences,
+    }
+    return OccurrenceIndex(data, "hebrew")
+
+
+@pytest.mark.parametrize("overrides, expected", [
+    ({}, list(range(12))),
+    # Non-Qal passive participles count as active participles...
+    ({"tense": {"Passive participle": False}}, [0, 1, 2, 3, 6, 7, 8, 9, 10, 11]),
+    # ...but not when Active participle is also deselected
+    (
+        {"tense": {"Passive participle": False, "Active participle": False}},
+        [0, 1, 2, 6, 7, 8, 9, 10, 11],
+    ),
+    # Qal laqah is excluded with 1-nun roots
+    ({"root": {"1-nun": False}}, [1, 3, 4, 5, 6, 7, 8, 9, 10, 11]),
+    ({"suffixes": {"include": False}}, [0, 1, 2, 3, 4, 5, 7, 8, 9, 10, 11]),
+    ({"suffixes": {"include": True, "exclusive": True}}, [6, 7]),
+    ({"suffixes": {"include": False, "exclusive": True}}, [0, 1, 2, 3, 4, 5, 7, 8, 9, 10, 11]),
+    ({"extras": {"cohortatives": False}}, [0, 1, 2, 3, 4, 5, 6, 7, 9, 10, 11]),
+    ({"extras": {"energicNuns": False}}, [0, 1, 2, 3, 4, 5, 6, 7, 8, 10, 11]),
+    ({"extras": {"paragogicHehs": False}}, [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 11]),
+    ({"extras": {"paragogicNuns": False}}, list(range(11))),
+    # A missing extras key is disallowed, as in getFilterFromConditions
+    ({"extras": {"cohortatives": None}}, [0, 1, 2, 3, 4, 5, 6, 7, 9, 10, 11]),
+    ({"minFrequency": 30}, list(range(12))),
+    ({"minFrequency": 31}, [0, 1, 2, 6, 7, 8, 9, 10, 11]),
+    ({"minFrequency": 50}, [0, 1, 2, 6, 7, 8, 9, 10, 11]),
+    ({"minFrequency": 51}, [0, 1, 2, 6, 7, 8, 9, 10]),
+    ({"minFrequency": 5000}, [6, 7, 8, 9, 10]),
+    ({"minFrequency": 5001}, []),
+    ({"books": [1]}, [1, 3, 5, 7, 9, 11]),
+])
+def test_query(index, overrides, expected):
+    condition = make_condition(**overrides)
+    assert index.get_occurrences(condition) == expected
+    if "books" not in overrides:
+        assert reference_filter(index, condition) == expected
+
+
+def test_no_condition(index):
+    assert index.get_occurrences(None) == list(range(12))
+
+
+def random_conditions(language, seed, n):
+    r = random.Random(seed)
+    base = make_condition(language)
+    for _ in range(n):
+        yield {
+            "stem": {s: r.random() < 0.7 for s in base["stem"]},
+            "tense": {t: r.random() < 0.7 for t in base["tense"]},
+            "root": {t: r.random() < 0.85 for t in ROOT_TYPES},
+            "suffixes": {
+                "include": r.random() < 0.7,
+                "exclusive": r.random() < 0.3,
+            },
+            "extras": {e: r.random() < 0.5 for e in EXTRAS},
+            "minFrequency": r.choice([0, 5, 10, 30, 50, 51, 100, 900, 5001]),
+        }
+
+
+def test_random_conditions_match_reference(index):
+    for condition in random_conditions("hebrew", 0, 500):
+        assert index.get_occurrences(condition) == reference_filter(index, condition)
+
+
+def test_built_data_matches_reference():
+    filename = os.path.join(os.path.dirname(__file__), "..", "public", "aramaic.json")
+    index = OccurrenceIndex.from_file(filename)
+    for condition in random_conditions("aramaic", 1, 500):
+        assert index.get_occurrences(condition) == reference_filter(index, condition)
+
+
+def test_unknown_language_file(tmp_path):
+    filename = tmp_path / "data.json"
+    filename.write_text(json.dumps({}))
+    with pytest.raises(ValueError, match="--language"):
+        OccurrenceIndex.from_file(str(filename))
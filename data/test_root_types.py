@@ -0,0 +1,114 @@
+import json
+import os
+import re
+import shutil
+import subprocess
+
+import pytest
+
+from hebrew import from_ascii
+from root_types import ROOT_TYPES, get_root_type_mask, get_root_types
+
+# Expected values follow getRootTypes in src/util.ts
+CASES = [
+    ("קטל", {"strong"}),
+    ("אבג", {"1-aleph"}),
+    ("אכל", {"1-aleph"}),
+    ("אמר", {"1-aleph"}),
+    ("עמד", {"1-gutteral"}),
+    ("נתן", {"1-nun"}),
+    ("ישׁב", {"1-waw"}),
+    ("הלך", {"1-gutteral", "1-waw"}),
+    ("שׁאל", {"2-gutteral"}),
+    ("בנה", {"3-heh"}),
+    ("מצא", {"3-aleph"}),
+    ("ראה", {"1-gutteral", "2-gutteral", "3-heh"}),
+    ("שׁים", {"hollow"}),
+    ("קום", {"hollow"}),
+    ("היה", {"1-gutteral", "3-heh"}),
+    ("חיה", {"1-gutteral", "3-heh"}),
+    ("צוה", {"3-heh"}),
+    ("פלל", {"geminate"}),
+    ("סבב", {"geminate"}),
+    ("חנן", {"1-gutteral", "geminate"}),
+]
+
+
+@pytest.mark.parametrize("root, expected", CASES)
+def test_get_root_types(root, expected):
+    assert get_root_types(root) == expected
+
+
+def test_root_type_mask():
+    assert get_root_type_mask("קטל") == 1 << ROOT_TYPES.index("strong")
+    assert get_root_type_mask("ראה") == (
+        1 << ROOT_TYPES.index("1-gutteral")
+        | 1 << ROOT_TYPES.index("2-gutteral")
+        | 1 << ROOT_TYPES.index("3-heh")
+    )
+
+
+def read_frontend_source(name):
+    filename = os.path.join(os.path.dirname(__file__), "..", "src", name)
+    with open(filename, encoding="utf-8") as file_object:
+        return file_object.read()
+
+
+def test_root_type_order_matches_frontend():
+    # Bits must line up with ALL_ROOT_TYPES in src/util.ts
+    source = read_frontend_source("util.ts")
+    start = source.index("ALL_ROOT_TYPES: RootKey[] = [")
+    end = source.index("]\n", start)
+    keys = [
+        line.strip().strip(",").strip("'")
+        for line in source[start:end].splitlines()[1:]
+    ]
+    assert keys == ROOT_TYPES
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="needs node")
+def test_root_types_match_frontend():
+    source = read_frontend_source("util.ts")
+    functions = []
+    for pattern in (
+        r"export const ALL_ROOT_TYPES: RootKey\[\] = \[.*?\n\]",
+        r"export function replaceSofits\(str: string\) \{.*?\n\}",
+        r"export function getRootTypes\(root: string\) \{.*?\n\}",
+        r"export function getRootTypeMask\(rootTypes: Set<RootKey>\) \{.*?\n\}",
+    ):
+        match = re.search(pattern, source, re.DOTALL)
+        assert match
+        functions.append(match.group(0))
+    script = (
+        "\n".join(functions)
+        .replace("export ", "")
+        .replace(": RootKey[]", "")
+        .replace("new Set<RootKey>()", "new Set()")
+        .replace(": Set<RootKey>", "")
+        .replace(": string", "")
+    )
+
+    filename = os.path.join(os.path.dirname(__file__), "..", "public", "aramaic.json")
+    with open(filename, encoding="utf-8") as file_object:
+        roots = [from_ascii(root[0]) for root in json.load(file_object)["roots"]]
+    roots += [root for root, _ in CASES]
+    script += (
+        f"\nconsole.log(JSON.stringify({json.dumps(roots)}.map("
+        "root => getRootTypeMask(getRootTypes(root))"
+        ")))"
+    )
+    result = subprocess.run(
+        ["node", "-e", script],
+        capture_output=True,
+        check=True,
+        encoding="utf-8",
+    )
+
+    def get_bits(mask):
+        return [root_type for i, root_type in enumerate(ROOT_TYPES) if mask & (1 << i)]
+
+    assert {
+        root: get_bits(mask) for root, mask in zip(roots, json.loads(result.stdout))
+    } == {
+        root: get_bits(get_root_type_mask(root)) for root in roots
+    }
@@ -0,0 +1,110 @@
+import json
+import os
+
+import pytest
+
+from hebrew import from_ascii, to_ascii
+from verse_text import (
+    build_dictionaries,
+    decode_text,
+    encode_text,
+    join_accents,
+    split_accents,
+    tokenize,
+)
+
+# Verses from the Aramaic build, with cantillation
+VERSES = [
+    "כֹּ֣לָּא מְּטָ֔א עַל־נְבוּכַדְנֶצַּ֖ר מַלְכָּֽא פ",
+    "אֱדַ֨יִן֙ דָּנִיֶּ֔אל עִם־מַלְכָּ֖א מַלִּ֑ל מַלְכָּ֖א לְעָלְמִ֥ין חֱיִֽי",
+    "וְאַרְבַּ֤ע חֵיוָן֙ רַבְרְבָ֔ן סָלְקָ֖ן מִן־יַמָּ֑א שָׁנְיָ֖ן דָּ֥א מִן־דָּֽא",
+]
+
+# Also decoded by src/verseText.spec.ts, from the encoding in
+# src/verseText.spec.json
+TEXTS = [
+    "",
+    "בְּרֵאשִׁית בָּרָא אֱלֹהִים",
+    "עַל־הָאָרֶץ",
+    "עַל־פְּנֵי־הַמָּיִם",
+    "כָּל־ הָאָרֶץ",
+    "־אֶת",
+    "אֶת ־הָאָרֶץ",
+    "אֶת־",
+    "וַיֹּאמֶר  אֱלֹהִים",
+    " וַיְהִי ",
+    *VERSES,
+]
+FRONTEND_FIXTURES = os.path.join(
+    os.path.dirname(__file__), "..", "src", "verseText.spec.json"
+)
+
+
+def encode_fixtures(texts):
+    words, accents = build_dictionaries(texts)
+    word_ids = {word: i for i, word in enumerate(words)}
+    accent_ids = {pattern: i for i, pattern in enumerate(accents)}
+    return {
+        "texts": texts,
+        "words": words,
+        "accents": accents,
+        "encoded": [encode_text(text, word_ids, accent_ids) for text in texts],
+    }
+
+
+def round_trip(texts):
+    words, accents = build_dictionaries(texts)
+    word_ids = {word: i for i, word in enumerate(words)}
+    accent_ids = {pattern: i for i, pattern in enumerate(accents)}
+    return [
+        decode_text(*encode_text(text, word_ids, accent_ids), words, accents)
+        for text in texts
+    ]
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_round_trip(text):
+    assert round_trip([text]) == [text]
+
+
+def test_round_trip_shared_dictionaries():
+    assert round_trip(VERSES) == VERSES
+
+
+def test_round_trip_through_ascii():
+    # The dictionaries are shipped as to_ascii strings
+    words, accents = build_dictionaries(VERSES)
+    word_ids = {word: i for i, word in enumerate(words)}
+    accent_ids = {pattern: i for i, pattern in enumerate(accents)}
+    words = [from_ascii(to_ascii(word)) for word in words]
+    accents = [from_ascii(to_ascii(pattern)) for pattern in accents]
+    for text in VERSES:
+        encoded = encode_text(text, word_ids, accent_ids)
+        assert decode_text(*encoded, words, accents) == text
+
+
+def test_maqef_words_share_entries():
+    assert tokenize("עַל־הָאָרֶץ הָאָרֶץ") == ["עַל־", "הָאָרֶץ", "הָאָרֶץ"]
+
+
+def test_accents_are_split_from_words():
+    word, pattern = split_accents("מַלְכָּ֖א")
+    assert word == "מַלְכָּא"
+    assert join_accents(word, pattern) == "מַלְכָּ֖א"
+    assert split_accents("מַלְכָּ֖א")[0] == split_accents("מַלְכָּ֑א")[0]
+    assert split_accents("מַלְכָּא") == ("מַלְכָּא", "")
+
+
+def test_dictionaries_ordered_by_frequency():
+    words, accents = build_dictionaries(["א ב ב", "ג ב ג"])
+    assert words == ["ב", "ג", "א"]
+    assert accents == [""]
+
+
+def test_frontend_fixtures_are_current():
+    # Regenerate with:
+    # python -c 'import json, test_verse_text as t; print(json.dumps(
+    #     t.encode_fixtures(t.TEXTS), ensure_ascii=False, indent=2))'
+    with open(FRONTEND_FIXTURES, encoding="utf-8") as file_object:
+        fixtures = json.load(file_object)
+    assert fixtures == json.loads(json.dumps(encode_fixtures(TEXTS)))
@@ -0,0 +1,99 @@
+import re
+
+from collections import Counter
+from typing import Dict, Iterable, List, Tuple
+
+MAQEF = "\u05be"
+
+# Split on spaces, and after each maqef so that maqef-joined words share
+# entries with the standalone forms
+TOKEN_BOUNDARY = re.compile(rf"(?<={MAQEF})| ")
+
+# Cantillation marks and meteg
+ACCENTS = re.compile(r"[\u0591-\u05af\u05bd]")
+
+# Stands for one character of the unaccented word in an accent pattern. A
+# space never occurs inside a token and is left as-is by to_ascii and
+# fromASCIIHebrew.
+PLACEHOLDER = " "
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_BOUNDARY.split(text)
+
+
+def detokenize(tokens: Iterable[str]) -> str:
+    # Mirrors decodeText in src/verseText.ts
+    text = ""
+    previous = None
+    for token in tokens:
+        if previous is not None and not previous.endswith(MAQEF):
+            text += " "
+        text += token
+        previous = token
+    return text
+
+
+def split_accents(token: str) -> Tuple[str, str]:
+    # The pattern keeps the token's accents in place, with a placeholder
+    # for each other character and trailing placeholders dropped
+    word = ACCENTS.sub("", token)
+    pattern = "".join(
+        c if ACCENTS.match(c) else PLACEHOLDER
+        for c in token
+    ).rstrip(PLACEHOLDER)
+    return word, pattern
+
+
+def join_accents(word: str, pattern: str) -> str:
+    # Mirrors joinAccents in src/verseText.ts
+    result = ""
+    i = 0
+    for c in pattern:
+        if c == PLACEHOLDER:
+            result += word[i]
+            i += 1
+        else:
+            result += c
+    return result + word[i:]
+
+
+def build_dictionaries(texts: Iterable[str]) -> Tuple[List[str], List[str]]:
+    # Unaccented word forms and accent patterns, each ordered by frequency
+    words = Counter()
+    accents = Counter()
+    for text in texts:
+        for token in tokenize(text):
+            word, pattern = split_accents(token)
+            words[word] += 1
+            accents[pattern] += 1
+    return (
+        [word for word, _ in words.most_common()],
+        [pattern for pattern, _ in accents.most_common()],
+    )
+
+
+def encode_text(
+    text: str,
+    word_ids: Dict[str, int],
+    accent_ids: Dict[str, int],
+) -> Tuple[List[int], List[int]]:
+    words = []
+    accents = []
+    for token in tokenize(text):
+        word, pattern = split_accents(token)
+        words.append(word_ids[word])
+        accents.append(accent_ids[pattern])
+    return words, accents
+
+
+def decode_text(
+    encoded_words: List[int],
+    encoded_accents: List[int],
+    words: List[str],
+    accents: List[str],
+) -> str:
+    return detokenize(
+        join_accents(words[w], accents[a])
+        for w, a in zip(encoded_words, encoded_accents)
+    )
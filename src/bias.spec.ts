@@ -0,0 +1,47 @@
+import { countByKey, countByRoot } from './bias'
+import type { LinkedCount, LinkedOccurrence, Root, VerbParsing } from './loadData'
+import { getRootTypeMask, getRootTypes } from './util'
+
+function makeRoot(root: string): Root {
+  const types = getRootTypes(root)
+  return { count: 0, gloss: '', root, types, typeMask: getRootTypeMask(types) }
+}
+
+function makeParsing(stem: VerbParsing['stem'], tense: VerbParsing['tense']) {
+  return { stem, tense } as VerbParsing
+}
+
+const natan = makeRoot('נתן')
+const raah = makeRoot('ראה')
+const qalQatal = makeParsing('Qal', 'Qatal')
+const qalYiqtol = makeParsing('Qal', 'Yiqtol')
+const hiphilQatal = makeParsing('Hiphil', 'Qatal')
+
+const counts: LinkedCount[] = [
+  { root: natan, parsings: [qalQatal], count: 2 },
+  { root: natan, parsings: [qalYiqtol, hiphilQatal], count: 1 },
+  { root: raah, parsings: [hiphilQatal], count: 3 },
+]
+const verbs = counts.flatMap(
+  ({ count, ...verb }) => Array.from({ length: count }, () => verb as LinkedOccurrence)
+)
+
+describe('grouped counts', () => {
+  it('countByRoot gives the same totals as the occurrences', () => {
+    expect(countByRoot(counts)).toEqual(countByRoot(verbs))
+    expect(countByRoot(counts)).toEqual({
+      '1-nun': 3,
+      '1-gutteral': 3,
+      '2-gutteral': 3,
+      '3-heh': 3,
+    })
+  })
+
+  it.each([
+    ['stem' as const, { Qal: 3, Hiphil: 4 }],
+    ['tense' as const, { Qatal: 6, Yiqtol: 1 }],
+  ])('countByKey(%s) gives the same totals as the occurrences', (key, expected) => {
+    expect(countByKey(key, counts)).toEqual(countByKey(key, verbs))
+    expect(countByKey(key, counts)).toEqual(expected)
+  })
+})
@@ -1,4 +1,4 @@
-import type { LinkedOccurrence, VerbParsing } from './loadData'
+import type { LinkedCount, LinkedOccurrence, VerbParsing } from './loadData'
 import type { RootKey } from './filter'
 
 export type BiasOptions = {
@@ -16,12 +16,13 @@ export function getRandomVerb(
 
 export function countByKey<K extends BiasCompatibleKey>(
   key: K,
-  verbs: LinkedOccurrence[],
+  verbs: (LinkedOccurrence | LinkedCount)[],
 ) {
   return verbs.reduce(
-    (acc, { parsings }) => {
-      for (const parsing of parsings) {
-        acc[parsing[key]] = (acc[parsing[key]] || 0) + 1
+    (acc, verb) => {
+      const count = 'count' in verb ? verb.count : 1
+      for (const parsing of verb.parsings) {
+        acc[parsing[key]] = (acc[parsing[key]] || 0) + count
       }
       return acc
     },
@@ -30,12 +31,13 @@ export function countByKey<K extends BiasCompatibleKey>(
 }
 
 export function countByRoot(
-  verbs: LinkedOccurrence[],
+  verbs: (LinkedOccurrence | LinkedCount)[],
 ) {
   return verbs.reduce(
-    (acc, { root }) => {
-      for (const rootType of root.types) {
-        acc[rootType] = (acc[rootType] || 0) + 1
+    (acc, verb) => {
+      const count = 'count' in verb ? verb.count : 1
+      for (const rootType of verb.root.types) {
+        acc[rootType] = (acc[rootType] || 0) + count
       }
       return acc
     },
@@ -46,30 +48,37 @@ export function countByRoot(
 export function getBiasedVerbs(
   biasOptions: BiasOptions,
   verbs: LinkedOccurrence[],
+  counts?: LinkedCount[],
 ) {
+  // Grouped counts that passed the same filter as verbs add up to the same
+  // totals, so the first pass can use them. Later passes count the verbs
+  // that are left.
   let workingVerbs = verbs
+  let workingCounts: (LinkedOccurrence | LinkedCount)[] = counts ?? verbs
   if (biasOptions.biasRoots) {
-    const rootCounts = countByRoot(workingVerbs)
+    const rootCounts = countByRoot(workingCounts)
     const biasRoots = getBiasFromCounts(rootCounts)
     workingVerbs = applyBias(
       workingVerbs,
       ({ root }) => root.types,
       biasRoots,
     )
+    workingCounts = workingVerbs
   }
 
   if (biasOptions.biasStems) {
-    const stemCounts = countByKey('stem', workingVerbs)
+    const stemCounts = countByKey('stem', workingCounts)
     const biasStems = getBiasFromCounts(stemCounts)
     workingVerbs = applyBias(
       workingVerbs,
       ({ parsings }) => parsings.map(p => p.stem),
       biasStems,
     )
+    workingCounts = workingVerbs
   }
 
   if (biasOptions.biasTenses) {
-    const tenseCounts = countByKey('tense', workingVerbs)
+    const tenseCounts = countByKey('tense', workingCounts)
     const biasTenses = getBiasFromCounts(tenseCounts)
     workingVerbs = applyBias(
       workingVerbs,
@@ -1,12 +1,18 @@
 import { FilterCondition, Stem, checkRootType } from './filter'
 import type { Root } from './loadData'
-import { getRootTypes } from './util'
+import { getRootTypeMask, getRootTypes } from './util'
 
 const defaultRoot: Root = {
   count: 0,
   gloss: '',
   root: '',
   types: new Set(),
+  typeMask: 0,
+}
+
+function makeRoot(root: string): Root {
+  const types = getRootTypes(root)
+  return { ...defaultRoot, root, types, typeMask: getRootTypeMask(types) }
 }
 
 describe('checkRootType', () => {
@@ -26,7 +32,7 @@ describe('checkRootType', () => {
       hollow: true,
       geminate: true,
     }
-    const rootObj = { ...defaultRoot, root: root, types: getRootTypes(root) }
+    const rootObj = makeRoot(root)
     const result = checkRootType(rootObj, condition, stem)
     expect(result).toBe(true)
   })
@@ -41,7 +47,7 @@ describe('checkRootType', () => {
     ['שׁים', { 'hollow': true }, 'Qal', true],
     ['ראה', { 'strong': true }, 'Qal', false],
   ])('checkRootType(%s, %s, %s) = %s', (root, condition, stem, expected) => {
-    const rootObj = { ...defaultRoot, root: root, types: getRootTypes(root) }
+    const rootObj = makeRoot(root)
     const result = checkRootType(rootObj, condition as FilterCondition['root'], stem as Stem)
     expect(result).toBe(expected)
   })
@@ -1,5 +1,5 @@
 import type { LinkedOccurrence, Root } from './loadData'
-import { hasSetPGN } from './util'
+import { ALL_ROOT_TYPES, hasSetPGN } from './util'
 
 export type FilterCondition = {
   'root': {
@@ -59,9 +59,11 @@ export type Tense = keyof FilterCondition['tense']
 
 export function getFilterFromConditions(
   condition: FilterCondition | undefined,
-): ((occurrence: LinkedOccurrence) => boolean) {
+): ((occurrence: Pick<LinkedOccurrence, 'root' | 'parsings'>) => boolean) {
   if (!condition) return () => true
 
+  const disallowedRootTypes = getDisallowedRootTypeMask(condition.root)
+
   return ({ root, parsings }) => {
     if (condition.minFrequency > root.count) {
       return false
@@ -110,7 +112,7 @@ export function getFilterFromConditions(
       return false
     }
 
-    if (!checkRootType(root, condition.root, parsings[0].stem)) {
+    if (!checkRootType(root, condition.root, parsings[0].stem, disallowedRootTypes)) {
       return false
     }
 
@@ -118,27 +120,22 @@ export function getFilterFromConditions(
   }
 }
 
+export function getDisallowedRootTypeMask(condition: FilterCondition['root']) {
+  return ALL_ROOT_TYPES.reduce(
+    (mask, rootType, i) => (condition[rootType] ? mask : mask | (1 << i)),
+    0,
+  )
+}
+
 export function checkRootType(
   root: Root,
   condition: FilterCondition['root'],
   stem: Stem,
+  disallowedRootTypes = getDisallowedRootTypeMask(condition),
 ) {
-  const rootTypes = root.types
-
   if (!condition['1-nun'] && root.root === 'לקח' && stem === 'Qal') {
     return false
   }
 
-  return !(
-    (!condition.strong && rootTypes.has('strong'))
-    || (!condition['1-gutteral'] && rootTypes.has('1-gutteral'))
-    || (!condition['1-aleph'] && rootTypes.has('1-aleph'))
-    || (!condition['1-nun'] && rootTypes.has('1-nun'))
-    || (!condition['1-waw'] && rootTypes.has('1-waw'))
-    || (!condition['2-gutteral'] && rootTypes.has('2-gutteral'))
-    || (!condition['3-heh'] && rootTypes.has('3-heh'))
-    || (!condition['3-aleph'] && rootTypes.has('3-aleph'))
-    || (!condition.hollow && rootTypes.has('hollow'))
-    || (!condition.geminate && rootTypes.has('geminate'))
-  )
+  return (root.typeMask & disallowedRootTypes) === 0
 }
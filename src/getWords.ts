@@ -1,6 +1,6 @@
 import { getBiasedVerbs, BiasOptions } from './bias'
 import { getFilterFromConditions, FilterCondition } from './filter'
-import { getLinkedOccurrences } from './loadData'
+import { getLinkedCounts, getLinkedOccurrences } from './loadData'
 
 function shuffleArray<T>(array: T[]): T[] {
   for (let i = array.length - 1; i > 0; i--) {
@@ -15,10 +15,12 @@ export default async function getWords({ biasOptions, filterConditions }: {
   filterConditions: FilterCondition,
 }) {
   const occurrencesPromise = getLinkedOccurrences()
+  const countsPromise = getLinkedCounts()
   const filter = getFilterFromConditions(filterConditions)
   const occurrences = await occurrencesPromise
   const validVerbs = occurrences.filter(filter)
-  const biasedVerbs = getBiasedVerbs(biasOptions, validVerbs)
+  const validCounts = (await countsPromise)?.filter(filter)
+  const biasedVerbs = getBiasedVerbs(biasOptions, validVerbs, validCounts)
 
   if (biasedVerbs.length === 0) {
     throw new Error('No valid verbs found')
@@ -1,5 +1,6 @@
 import type { Stem, Tense } from './filter'
-import { getRootTypes } from './util'
+import { getRootTypeMask, getRootTypes, getRootTypesFromMask } from './util'
+import { decodeText } from './verseText'
 
 export type NA = 'N/A'
 export type Person = 1 | 2 | 3 | NA
@@ -31,14 +32,27 @@ type DataParsing = [
   0 | 1,
   0 | 1,
 ]
-type DataVerse = [
+type PlainDataVerse = [
   number,
   number,
   number,
   string,
 ]
+type EncodedDataVerse = [
+  number,
+  number,
+  number,
+  number[],
+  number[],
+]
+type DataVerse = PlainDataVerse | EncodedDataVerse
 type DataBook = string
-type DataRoot = [string, number, string]
+type DataRoot = [string, number, string, number?]
+type DataCount = number[]
+type DataSpellings = {
+  groups: number[],
+  parsings: number[][],
+}
 
 const isAramaic = import.meta.env.VITE_LANGUAGE === 'aramaic'
 
@@ -107,13 +121,21 @@ export function processRoots(roots: DataRoot[]) {
     root,
     count,
     gloss,
+    typeMask,
   ]) => {
     const r = fromASCIIHebrew(root)
+    // Root types are computed by the data build; older data files lack them
+    const types = (
+      typeMask === undefined
+        ? getRootTypes(r)
+        : getRootTypesFromMask(typeMask)
+    )
     return {
       root: r,
       count,
       gloss,
-      types: getRootTypes(r),
+      types,
+      typeMask: typeMask ?? getRootTypeMask(types),
     }
   })
 }
@@ -121,23 +143,32 @@ export type Root = ReturnType<typeof processRoots>[number]
 export type RootMap = Record<number, Root>
 
 
-export function processVerses(verses: DataVerse[]) {
+export function processVerses(
+  verses: DataVerse[],
+  words: string[] = [],
+  accents: string[] = [],
+) {
+  const wordDictionary = words.map(fromASCIIHebrew)
+  const accentDictionary = accents.map(fromASCIIHebrew)
   return verses.map(
-    ([
-      book,
-      chapter,
-      verse,
-      text,
-    ]) => ({
-      book,
-      chapter,
-      verse,
-      text: fromASCIIHebrew(text),
+    row => ({
+      book: row[0],
+      chapter: row[1],
+      verse: row[2],
+      text: (
+        isPlainDataVerse(row)
+          ? fromASCIIHebrew(row[3])
+          : decodeText(row[3], row[4], wordDictionary, accentDictionary)
+      ),
     })
   )
 }
 export type Verse = ReturnType<typeof processVerses>[number]
 
+function isPlainDataVerse(row: DataVerse): row is PlainDataVerse {
+  return typeof row[3] === 'string'
+}
+
 
 export function processVerbs(verbs: DataVerb[]) {
   return verbs.map(
@@ -170,6 +201,24 @@ export function processParsings(parsings: DataParsing[]) {
 export type VerbParsing = ReturnType<typeof processParsings>[number]
 
 
+export function processSpellings(spellings: DataSpellings, parsings: VerbParsing[]) {
+  // The parsings of every occurrence with the same spelling, for each verb,
+  // in the same form as getAllValidParsings returns them
+  const groupParsings = spellings.parsings.map(
+    counts => {
+      const result: VerbParsing[] = []
+      for (let i = 0; i < counts.length; i += 2) {
+        for (let j = 0; j < counts[i + 1]; j++) {
+          result.push(parsings[counts[i]])
+        }
+      }
+      return result
+    }
+  )
+  return spellings.groups.map(group => groupParsings[group])
+}
+
+
 export function processOccurrences(occurrences: DataOccurrence[]) {
   return occurrences.map(
     data => ({
@@ -188,6 +237,21 @@ export type LinkedOccurrence = {
   verb: Verb,
   verse: Verse,
   node: number,
+  sameSpellingParsings?: VerbParsing[],
+}
+
+
+export function processCounts(counts: DataCount[]) {
+  return counts.map(
+    data => ({
+      root: data[0],
+      count: data[1],
+      parsings: data.slice(2),
+    })
+  )
+}
+export type LinkedCount = Pick<LinkedOccurrence, 'root' | 'parsings'> & {
+  count: number,
 }
 
 
@@ -264,14 +328,23 @@ export async function loadData() {
     roots: DataRoot[],
     verbs: DataVerb[],
     verses: DataVerse[],
+    words?: string[],
+    accents?: string[],
+    spellings?: DataSpellings,
+    counts?: DataCount[],
   }
+  const parsings = processParsings(data.parsings)
   return {
     books: data.books,
     roots: processRoots(data.roots),
     verbs: processVerbs(data.verbs),
-    parsings: processParsings(data.parsings),
-    verses: processVerses(data.verses),
+    parsings,
+    verses: processVerses(data.verses, data.words, data.accents),
     occurrences: processOccurrences(data.occurrences),
+    // Older data files don't include the spelling groups
+    spellings: data.spellings && processSpellings(data.spellings, parsings),
+    // Only included when the data build has WRITE_BIAS_COUNTS set
+    counts: data.counts && processCounts(data.counts),
   }
 }
 const dataPromise = loadData()
@@ -286,6 +359,18 @@ export async function getLinkedOccurrences() {
       verb: data.verbs[verb],
       verse: data.verses[verse],
       node,
+      sameSpellingParsings: data.spellings?.[verb],
     } as LinkedOccurrence)
   )
 }
+
+export async function getLinkedCounts() {
+  const data = await dataPromise
+  return data.counts?.map(
+    ({ root, count, parsings }) => ({
+      root: data.roots[root],
+      parsings: parsings.map(p => data.parsings[p]),
+      count,
+    } as LinkedCount)
+  )
+}
@@ -59,6 +59,18 @@ export const ALL_TENSES: Tense[] = isAramaic ? [
   'Infinitive construct',
   'Infinitive absolute',
 ]
+export const ALL_ROOT_TYPES: RootKey[] = [
+  'strong',
+  '1-gutteral',
+  '1-aleph',
+  '1-nun',
+  '1-waw',
+  '2-gutteral',
+  '3-heh',
+  '3-aleph',
+  'hollow',
+  'geminate',
+]
 export const ALL_PERSONS: Person[] = [3, 2, 1]
 export const ALL_GENDERS: Gender[] = ['m', 'f', 'c']
 export const ALL_NUMBERS: VerbNumber[] = ['s', 'p']
@@ -220,6 +232,17 @@ export function getRootTypes(root: string) {
   return rootTypes
 }
 
+export function getRootTypeMask(rootTypes: Set<RootKey>) {
+  return ALL_ROOT_TYPES.reduce(
+    (mask, rootType, i) => (rootTypes.has(rootType) ? mask | (1 << i) : mask),
+    0,
+  )
+}
+
+export function getRootTypesFromMask(mask: number) {
+  return new Set(ALL_ROOT_TYPES.filter((_, i) => mask & (1 << i)))
+}
+
 export function replaceSofits(str: string) {
   return (
     str
@@ -427,6 +450,11 @@ export function hasSameSpelling(a: LinkedOccurrence, b: LinkedOccurrence) {
 }
 
 export function getAllValidParsings(occurrence: LinkedOccurrence, occurrences: LinkedOccurrence[]) {
+  // Precomputed by the data build when available
+  if (occurrence.sameSpellingParsings) {
+    return occurrence.sameSpellingParsings
+  }
+
   const allOccurrences = occurrences.filter(
     o => hasSameSpelling(o, occurrence)
   )
@@ -0,0 +1,26 @@
+import { decodeText, joinAccents } from './verseText'
+// Encoded by data/verse_text.py (see test_frontend_fixtures_are_current)
+import fixtures from './verseText.spec.json'
+
+describe('decodeText', () => {
+  it.each(
+    fixtures.texts.map((text, i) => ({
+      text,
+      wordIds: fixtures.encoded[i][0],
+      accentIds: fixtures.encoded[i][1],
+    }))
+  )('decodes "$text"', ({ text, wordIds, accentIds }) => {
+    expect(decodeText(wordIds, accentIds, fixtures.words, fixtures.accents)).toBe(text)
+  })
+})
+
+describe('joinAccents', () => {
+  it.each([
+    ['מַלְכָּא', '', 'מַלְכָּא'],
+    ['מַלְכָּא', ' '.repeat(7) + '\u0596', 'מַלְכָּ֖א'],
+    ['מַלְכָּא', ' '.repeat(7) + '\u0591', 'מַלְכָּ֑א'],
+    ['עַל־', '', 'עַל־'],
+  ])('joinAccents(%s, %j) = %s', (word, pattern, expected) => {
+    expect(joinAccents(word, pattern)).toBe(expected)
+  })
+})
@@ -0,0 +1,37 @@
+const maqef = '\u05be'
+const accentPlaceholder = ' '
+
+export function joinAccents(word: string, pattern: string) {
+  // Mirrors join_accents in data/verse_text.py
+  let result = ''
+  let i = 0
+  for (const c of pattern) {
+    if (c === accentPlaceholder) {
+      result += word[i]
+      i += 1
+    } else {
+      result += c
+    }
+  }
+  return result + word.slice(i)
+}
+
+export function decodeText(
+  wordIds: number[],
+  accentIds: number[],
+  words: string[],
+  accents: string[],
+) {
+  // Mirrors decode_text and detokenize in data/verse_text.py
+  let text = ''
+  let previous: string | undefined
+  wordIds.forEach((wordId, i) => {
+    const token = joinAccents(words[wordId], accents[accentIds[i]])
+    if (previous !== undefined && !previous.endsWith(maqef)) {
+      text += ' '
+    }
+    text += token
+    previous = token
+  })
+  return text
+}